@@ -6,26 +6,56 @@ syntax.
 """
 
 import re
+import sys
 from collections.abc import Iterable
-from typing import NamedTuple
-from collections import ChainMap
 from copy import copy, deepcopy
+from itertools import groupby
 
 from .util import SingleDispatchBase, parse_iso_date
 
 
-_OrgNodeTypeBase = NamedTuple('OrgNodeType', [
-	('name', str),
-	('is_element', bool),
-	('is_greater_element', bool),
-	('is_recursive', bool),
-	('is_object_container', bool),
-])
+#: Pattern matching characters to replace when converting header titles to IDs.
+_SLUG_RE = re.compile(r'[^\w_-]+')
 
+_to_plaintext = None
 
-class OrgNodeType(_OrgNodeTypeBase):
+
+def _get_to_plaintext():
+	"""Get :func:`pyorg.convert.plaintext.to_plaintext`, importing on first use.
+
+	The convert subpackage imports this module, so the import can't happen at
+	module scope; binding it lazily here avoids paying the sys.modules lookup
+	of an inline import statement on every headline construction.
+	"""
+	global _to_plaintext
+	if _to_plaintext is None:
+		from pyorg.convert.plaintext import to_plaintext
+		_to_plaintext = to_plaintext
+	return _to_plaintext
+
+
+_slug_cache = {}
+
+
+def _slugify(title):
+	"""Convert a header title to its ID slug, memoizing the result.
+
+	Titles repeat across documents (and across repeat loads of the same
+	document), so this usually avoids the regex substitution entirely.
+	"""
+	try:
+		return _slug_cache[title]
+	except KeyError:
+		slug = _slug_cache[title] = _SLUG_RE.sub('-', title).strip('-')
+		return slug
+
+
+class OrgNodeType:
 	"""The properties of an org AST node type.
 
+	Instances are singletons (see :data:`.ORG_NODE_TYPES`) compared by
+	identity, with slot attribute access and an interned name.
+
 	Attributes
 	----------
 	name : str
@@ -51,15 +81,31 @@ class OrgNodeType(_OrgNodeTypeBase):
 	`Org Syntax <https://orgmode.org/worg/dev/org-syntax.html>`_
 	"""
 
-	@property
-	def is_object(self):
-		return not self.is_element
+	__slots__ = (
+		'name', 'is_element', 'is_object', 'is_greater_element', 'is_recursive',
+		'is_object_container',
+	)
+
+	def __init__(self, name, is_element, is_greater_element, is_recursive, is_object_container):
+		self.name = sys.intern(name)
+		self.is_element = is_element
+		self.is_object = not is_element
+		self.is_greater_element = is_greater_element
+		self.is_recursive = is_recursive
+		self.is_object_container = is_object_container
 
 	def __repr__(self):
-		return '%s(%r)' % (type(self).__name__, self.name)
+		return f'{type(self).__name__}({self.name!r})'
+
+	def __reduce__(self):
+		# Unpickle to the registered singleton (pickled ASTs would otherwise
+		# come back with copies that break identity comparisons).
+		return (as_node_type, (self.name,))
 
 
 #: Mapping from names of all AST node types to :class:`.OrgNodeType` instances.
+#: Names are interned (in ``OrgNodeType.__init__``) so that lookups and
+#: comparisons hit the string identity fast path.
 ORG_NODE_TYPES = {nt.name: nt for nt in [
 	#           Name                   Element Greater Recursive Container
 	OrgNodeType('org-data',            True,   True,   False,    False,    ),
@@ -118,6 +164,16 @@ ORG_NODE_TYPES = {nt.name: nt for nt in [
 ]}
 
 
+# Singleton type instances for identity comparisons on hot construction
+# paths - node constructors coerce string types through ORG_NODE_TYPES, so
+# a node's type is always the table instance.
+_ORG_DATA_TYPE = ORG_NODE_TYPES['org-data']
+_SECTION_TYPE = ORG_NODE_TYPES['section']
+_HEADLINE_TYPE = ORG_NODE_TYPES['headline']
+_TIMESTAMP_TYPE = ORG_NODE_TYPES['timestamp']
+_TABLE_ROW_TYPE = ORG_NODE_TYPES['table-row']
+
+
 #: Mapping from org element/node types to their Python class
 NODE_CLASSES = {}
 
@@ -131,9 +187,12 @@ def node_cls(type_):
 	return decorator
 
 
-def dump_ast(value, properties=False, indent='  ', _level=0):
+def dump_ast(value, properties=False, indent='  ', _level=0, _out=None):
 	"""Print a debug representation of an org AST node and its descendants.
 
+	Output is buffered into a list of fragments and written to stdout in a
+	single call at the top level, instead of one print() per line.
+
 	Parameters
 	----------
 	value : .OrgNode
@@ -142,30 +201,39 @@ def dump_ast(value, properties=False, indent='  ', _level=0):
 	indent : str
 		Characters to indent with.
 	"""
+	top = _out is None
+	out = [] if top else _out
+	append = out.append
 
 	if isinstance(value, OrgNode):
 
-		print(value.type.name)
+		append(value.type.name + '\n')
+		pad = indent * (_level + 1)
 
 		if properties:
-			for key in sorted(value.properties):
-				print('%s:%-15s = ' % (indent * (_level + 1), key), end='')
-				dump_ast(value.properties[key], properties, indent, _level + 1)
+			vprops = value.properties
+			for key in sorted(vprops):
+				append(f'{pad}:{key:<15} = ')
+				dump_ast(vprops[key], properties, indent, _level + 1, out)
 
 		for i, child in enumerate(value.contents):
-			print('%s%d ' % (indent * (_level + 1), i), end='')
-			dump_ast(child, properties, indent, _level + 1)
+			append(f'{pad}{i} ')
+			dump_ast(child, properties, indent, _level + 1, out)
 
 	# Special printing for secondary strings, which are lists containing more nodes
 	elif isinstance(value, list) and any(isinstance(item, OrgNode) for item in value):
-		print('[')
+		append('[\n')
+		pad = indent * (_level + 1)
 		for item in value:
-			print(indent * (_level + 1), end='')
-			dump_ast(item, properties, indent, _level + 1)
-		print((indent * _level) + ']')
+			append(pad)
+			dump_ast(item, properties, indent, _level + 1, out)
+		append((indent * _level) + ']\n')
 
 	else:
-		print(repr(value))
+		append(repr(value) + '\n')
+
+	if top:
+		sys.stdout.write(''.join(out))
 
 
 class OrgTimestampInterval:
@@ -212,9 +280,26 @@ class OrgTimestamp:
 
 	def __repr__(self):
 		if self.is_range:
-			return '<%s %s %s to %s>' % (type(self).__name__, self.tstype, self.start, self.end)
+			return f'<{type(self).__name__} {self.tstype} {self.start} to {self.end}>'
 		else:
-			return '<%s %s %s>' % (type(self).__name__, self.tstype, self.start or self.end)
+			return f'<{type(self).__name__} {self.tstype} {self.start or self.end}>'
+
+
+# Concrete container types encountered while walking node data, checked
+# before falling back to the much slower Iterable ABC instance check.
+_ITER_TYPES = (
+	list, tuple, set, frozenset, dict,
+	type({}.keys()), type({}.values()), type({}.items()),
+)
+
+
+def _values_may_contain_nodes(values):
+	"""Shallow check for whether any of a node's property/keyword values could
+	contain child nodes. Scalar values can't, any container might."""
+	for value in values:
+		if not isinstance(value, (str, int, float, bool, type(None))):
+			return True
+	return False
 
 
 class OrgNode:
@@ -244,19 +329,26 @@ class OrgNode:
 		Whether this node is an outline node.
 	"""
 
+	__slots__ = ('type', 'properties', 'keywords', 'contents', 'ref', 'meta')
+
 	is_outline = False
 
 	def __init__(self, type_, properties=None, contents=None, keywords=None, ref=None, meta=None):
 		if isinstance(type_, str):
 			type_ = ORG_NODE_TYPES[type_]
-		if not isinstance(type_, OrgNodeType):
+		elif not isinstance(type_, OrgNodeType):
 			raise TypeError(type(type_))
 		self.type = type_
 
-		self.properties = dict(properties or {})
-		self.keywords = dict(keywords or {})
+		# Arguments that are already plain dicts/lists are adopted by
+		# reference instead of copied - internal callers (the JSON loader in
+		# particular) pass freshly built containers that would otherwise be
+		# allocated and filled twice. Callers passing a container they intend
+		# to keep and mutate should copy it themselves.
+		self.properties = properties if type(properties) is dict else dict(properties or {})
+		self.keywords = keywords if type(keywords) is dict else dict(keywords or {})
 		self.ref = ref
-		self.contents = list(contents or [])
+		self.contents = contents if type(contents) is list else list(contents or [])
 		self.meta = dict(meta or [])
 
 	def __copy__(self, deep=False):
@@ -273,32 +365,65 @@ class OrgNode:
 		return self.__copy__(deep=True)
 
 	@staticmethod
-	def _iter_children_recursive(obj):
+	def _collect_children(obj, out):
 		"""
-		Iterate through child nodes through recursive data structures (e.g.
-		property values that are lists that contain nodes) but don't recurse
-		into the children themselves.
+		Collect child nodes from recursive data structures (e.g. property
+		values that are lists that contain nodes) into ``out``, without
+		recursing into the children themselves.
+
+		Appends to a plain list through an explicit stack - a recursive
+		generator here would pay frame setup and suspend/resume cost for
+		every node visited.
 		"""
-		# Return nodes directly
-		if isinstance(obj, OrgNode):
-			yield obj
+		append = out.append
+		stack = [obj]
+
+		while stack:
+			obj = stack.pop()
+
+			# Fast paths on exact type - nearly all values encountered are
+			# plain strings or lists, and identity comparison skips the MRO
+			# scan isinstance pays (Iterable's abstract check especially).
+			t = type(obj)
+
+			# Skip strings - otherwise we get infinite recursion trying to iterate
+			if t is str:
+				continue
 
-		# Skip strings - otherwise we get infinite recursion trying to iterate
-		elif isinstance(obj, str):
-			return
+			# Push contents of lists and tuples (reversed, to collect their
+			# items in order)
+			if t is list or t is tuple:
+				stack.extend(reversed(obj))
 
-		# Iterate through lists and other collections
-		elif isinstance(obj, Iterable):
-			for item in obj:
-				yield from OrgNode._iter_children_recursive(item)
+			# Collect nodes directly
+			elif isinstance(obj, OrgNode):
+				append(obj)
 
-		# Ignore
+			elif isinstance(obj, str):
+				continue
+
+			elif isinstance(obj, _ITER_TYPES) or isinstance(obj, Iterable):
+				stack.extend(reversed(list(obj)))
+
+			# Ignore
 
 	@property
 	def children(self):
 		"""Iterator over all child AST nodes (in contents or keyword/property values."""
-		for collection in (self.properties.values(), self.keywords.values(), self.contents):
-			yield from self._iter_children_recursive(collection)
+		# Seed a single walk with every collection that can contain nodes
+		# rather than running the walker once per collection. The shallow
+		# scalar scan runs per call (it's cheap relative to the walk), so
+		# values added to the public dicts after construction are seen.
+		roots = []
+		if self.properties and _values_may_contain_nodes(self.properties.values()):
+			roots.append(self.properties.values())
+		if self.keywords and _values_may_contain_nodes(self.keywords.values()):
+			roots.append(self.keywords.values())
+		roots.append(self.contents)
+
+		out = []
+		self._collect_children(roots if len(roots) > 1 else self.contents, out)
+		return iter(out)
 
 	def descendants(self, incself=False, properties=False):
 		"""Recursively iterate over all of the node's descendants.
@@ -315,14 +440,24 @@ class OrgNode:
 		-------
 		.OrgNode
 		"""
+		# Iterative pre-order walk - the recursive version allocated a
+		# generator and a Python frame per node visited.
 		if incself:
-			yield self
+			stack = [self]
+		else:
+			stack = list(self.children if properties else self.contents)
+			stack.reverse()
 
-		for item in (self.children if properties else self.contents):
-			yield from item.descendants(incself=True, properties=properties)
+		while stack:
+			node = stack.pop()
+			# Attribute access raises for plain-string contents, like the
+			# recursive call did, before the item is yielded.
+			children = node.children if properties else node.contents
+			yield node
+			stack.extend(reversed(list(children)))
 
 	def __repr__(self):
-		return '%s(type=%r)' % (type(self).__name__, self.type.name)
+		return f'{type(self).__name__}(type={self.type.name!r})'
 
 	def __len__(self):
 		return len(self.contents)
@@ -331,12 +466,18 @@ class OrgNode:
 		return iter(self.contents)
 
 	def __getitem__(self, key):
+		# Property access by string key is by far the most common use, so
+		# check it first by type identity before the isinstance fallbacks.
+		t = type(key)
+		if t is str:
+			return self.properties[key]
+		if t is int:
+			return self.contents[key]
 		if isinstance(key, int):
 			return self.contents[key]
-		elif isinstance(key, str):
+		if isinstance(key, str):
 			return self.properties[key]
-		else:
-			raise TypeError('Expected str or int, got %r' % type(key))
+		raise TypeError(f'Expected str or int, got {type(key)!r}')
 
 	def dump(self, properties=False, indent='  '):
 		"""Print a debug representation of the node and its descendants.
@@ -365,9 +506,12 @@ class OrgOutlineNode(OrgNode):
 		Org node with type `"section"` that contains the outline node's direct
 		content (not part of any nested outline nodes).
 	subheadings : list
-		List of nested headings.
+		List of nested headings. Computed from :attr:`contents` on first access
+		and cached.
 	"""
 
+	__slots__ = ('_section', '_subheadings')
+
 	is_outline = True
 
 	def __new__(cls, *args, **kwargs):
@@ -375,25 +519,53 @@ class OrgOutlineNode(OrgNode):
 			raise TypeError("Can't instantiate abstract base class directly")
 		return object.__new__(cls)
 
+	def _split_contents(self):
+		"""Split contents into leading section node (if any) and subheadings."""
+		if self.contents and self.contents[0].type is _SECTION_TYPE:
+			self._section = self.contents[0]
+			self._subheadings = self.contents[1:]
+		else:
+			self._section = None
+			self._subheadings = list(self.contents)
+
 	@property
 	def section(self):
-		if self.contents and self.contents[0].type.name == 'section':
-			return self.contents[0]
-		return None
+		try:
+			return self._section
+		except AttributeError:
+			self._split_contents()
+			return self._section
 
 	@property
 	def subheadings(self):
-		if self.contents and self.contents[0].type.name == 'section':
-			return self.contents[1:]
-		return self.contents[:]
+		try:
+			return self._subheadings
+		except AttributeError:
+			self._split_contents()
+			return self._subheadings
 
 	def outline_tree(self):
 		"""Create a list of ``(child, child_tree)`` pairs."""
-		return [(child, child.outline_tree()) for child in self.subheadings]
+		# Built iteratively - subtrees are filled in through the shared list
+		# objects instead of recursing once per heading.
+		tree = []
+		stack = [(self, tree)]
+
+		while stack:
+			node, out = stack.pop()
+			for child in node.subheadings:
+				child_tree = []
+				out.append((child, child_tree))
+				stack.append((child, child_tree))
+
+		return tree
 
 	def dump_outline(self, depth=None, indent='  '):
 		"""Print representation of node's outline subtree.
 
+		Output is accumulated into a buffer and written to stdout in a single
+		call rather than line-by-line prints.
+
 		Parameters
 		----------
 		depth : int
@@ -401,18 +573,18 @@ class OrgOutlineNode(OrgNode):
 		indent : str
 			String to indent with.
 		"""
-		self._dump_outline(None, 0, depth, indent)
+		out = []
+		self._dump_outline(None, 0, depth, indent, out)
+		sys.stdout.write(''.join(out))
 
-	def _dump_outline(self, n, depth, maxdepth, indent):
-		print(indent * depth, end='')
-		if n is not None:
-			print('%d. ' % n, end='')
-		print(self._dump_name())
+	def _dump_outline(self, n, depth, maxdepth, indent, out):
+		num = '' if n is None else f'{n}. '
+		out.append(f'{indent * depth}{num}{self._dump_name()}\n')
 
 		if maxdepth is None or depth < maxdepth:
 			nextdepth = None if depth is None else depth + 1
 			for (i, child) in enumerate(self.subheadings):
-				child._dump_outline(i, nextdepth, maxdepth, indent)
+				child._dump_outline(i, nextdepth, maxdepth, indent, out)
 
 	def _dump_name(self):
 		"""Get the name to show for this node when dumping outline."""
@@ -441,19 +613,30 @@ class OrgHeadlineNode(OrgOutlineNode):
 		The timestamp in the "closed" property of the headline, if present.
 	"""
 
+	__slots__ = ('_title', 'id', 'level')
+
 	def __init__(self, type_, *args, title=None, id=None, **kw):
 		super().__init__(type_, *args, **kw)
-		assert self.type.name == 'headline'
+		assert self.type is _HEADLINE_TYPE
 
-		# Default title
-		if title is None:
-			from pyorg.convert.plaintext import to_plaintext
-			title = to_plaintext(self['title'], blanks=True)
-
-		self.title = title
+		self._title = title
 		self.id = self.ref if id is None else id
 		self.level = self['level']
 
+	@property
+	def title(self):
+		# Default title is rendered from the title property on first access -
+		# converting the secondary string to plain text walks its nodes, and
+		# many headlines are never displayed.
+		title = self._title
+		if title is None:
+			title = self._title = _get_to_plaintext()(self['title'], blanks=True)
+		return title
+
+	@title.setter
+	def title(self, value):
+		self._title = value
+
 	@property
 	def has_todo(self):
 		return self['todo-type'] is not None
@@ -485,9 +668,11 @@ class OrgDataNode(OrgOutlineNode):
 	Doesn't do anything special, aside from being the outline node at level 0.
 	"""
 
+	__slots__ = ()
+
 	def __init__(self, type_, *args, **kw):
 		super().__init__(type_, *args, **kw)
-		assert self.type.name == 'org-data'
+		assert self.type is _ORG_DATA_TYPE
 
 	def _dump_name(self):
 		return 'Root'
@@ -497,16 +682,51 @@ class OrgDataNode(OrgOutlineNode):
 class OrgTimestampNode(OrgNode, OrgTimestamp):
 	"""An org node with type "timestamp"."""
 
+	# No additional slots - the timestamp attributes are stored in the
+	# instance dict provided by the (unslotted) OrgTimestamp base.
+	__slots__ = ()
+
 	def __init__(self, type_, *args, **kwargs):
 		OrgNode.__init__(self, type_, *args, **kwargs)
-		assert self.type.name == 'timestamp'
+		assert self.type is _TIMESTAMP_TYPE
 
-		OrgTimestamp.__init__(
-			self,
-			self['type'],
-			start=parse_iso_date(self['start']) if self.properties.get('start') else None,
-			end=parse_iso_date(self['end']) if self.properties.get('end') else None,
-		)
+		# OrgTimestamp.__init__ is deliberately not called - start/end are
+		# parsed from the node properties on first access instead, since many
+		# consumers of a loaded document never read them and ISO date parsing
+		# is comparatively expensive.
+		self.tstype = self['type']
+		self.repeater = None
+		self.warning = None
+
+	@property
+	def start(self):
+		try:
+			return self._start
+		except AttributeError:
+			value = parse_iso_date(self['start']) if self.properties.get('start') else None
+			self._start = value
+			return value
+
+	@start.setter
+	def start(self, value):
+		self._start = value
+
+	@property
+	def end(self):
+		try:
+			return self._end
+		except AttributeError:
+			if self.properties.get('end'):
+				value = parse_iso_date(self['end'])
+			else:
+				# Matches the OrgTimestamp default of end=start.
+				value = self.start
+			self._end = value
+			return value
+
+	@end.setter
+	def end(self, value):
+		self._end = value
 
 
 @node_cls('table')
@@ -523,39 +743,68 @@ class OrgTableNode(OrgNode):
 		Number of columns in table.
 	"""
 
-	def blocks(self):
-		"""Standard rows divided into "blocks", which were separated by rule rows.
+	__slots__ = ('_rows', '_blocks')
 
-		Returns
-		-------
-		list of list of OrgNode
+	def _scan_contents(self):
+		"""Partition contents into standard rows and rule-separated blocks.
+
+		One pass populates both caches - converters tend to ask for rows,
+		nrows and blocks for the same table. The cached lists are shared by
+		later calls and should be treated as read-only; they do not track
+		mutation of contents.
 		"""
+		def rowtype(row):
+			assert row.type is _TABLE_ROW_TYPE
+			return row['type']
+
+		rows = []
 		current_block = []
 		blocks = [current_block]
 
-		for row in self.contents:
-			assert row.type.name == 'table-row'
-
-			if row['type'] == 'rule':
-				# New block
-				current_block = []
-				blocks.append(current_block)
+		# Grouping runs of same-typed rows lets each run be handled with
+		# batch list operations. Every rule row still starts a new block, so
+		# consecutive rules produce empty blocks exactly as before.
+		for type_, group in groupby(self.contents, key=rowtype):
+			if type_ == 'rule':
+				for _ in group:
+					current_block = []
+					blocks.append(current_block)
 
-			elif row['type'] == 'standard':
-				current_block.append(row.contents)
+			elif type_ == 'standard':
+				run = list(group)
+				rows.extend(run)
+				current_block.extend(row.contents for row in run)
 
 			else:
 				raise ValueError()
 
-		return blocks
+		self._rows = rows
+		self._blocks = blocks
+
+	def blocks(self):
+		"""Standard rows divided into "blocks", which were separated by rule rows.
+
+		Returns
+		-------
+		list of list of OrgNode
+		"""
+		try:
+			return self._blocks
+		except AttributeError:
+			self._scan_contents()
+			return self._blocks
 
 	@property
 	def rows(self):
-		return [row for row in self.contents if row['type'] == 'standard']
+		try:
+			return self._rows
+		except AttributeError:
+			self._scan_contents()
+			return self._rows
 
 	@property
 	def nrows(self):
-		return sum(row['type'] == 'standard' for row in self.contents)
+		return len(self.rows)
 
 	@property
 	def ncols(self):
@@ -567,20 +816,44 @@ class OrgTableNode(OrgNode):
 
 def get_node_type(obj, name=False):
 	"""Get type of AST node, returning None for other Python types."""
-	if isinstance(obj, OrgNode):
+	if type(obj) is OrgNode or isinstance(obj, OrgNode):
 		return obj.type.name if name else obj.type
 	return None
 
 
+# Seeded with a unique sentinel key so no argument (None included) can hit
+# the lookaside before the first successful string lookup.
+_last_node_type = (object(), None)
+
+
 def as_node_type(t):
 	"""Convert to node type object, looking up strings by name."""
+	# Lookaside for the last string converted - callers tend to convert the
+	# same name repeatedly (e.g. registering or dispatching runs of nodes of
+	# one type), and the identity check is cheaper than the dict probe.
+	global _last_node_type
+	key, value = _last_node_type
+	if t is key:
+		return value
 	if isinstance(t, str):
-		return ORG_NODE_TYPES[t]
+		value = ORG_NODE_TYPES[t]
+		_last_node_type = (t, value)
+		return value
 	if isinstance(t, OrgNodeType):
 		return t
 	raise TypeError(type(t))
 
 
+class SecondaryString(list):
+	"""A list of nodes and strings already validated as a secondary string.
+
+	:func:`as_secondary_string` returns instances of this class and passes
+	them through without revalidating their items.
+	"""
+
+	__slots__ = ()
+
+
 def as_secondary_string(obj):
 	"""Convert argument to a "secondary string" (list of nodes or strings).
 
@@ -590,19 +863,22 @@ def as_secondary_string(obj):
 
 	Returns
 	-------
-	list
+	.SecondaryString
 
 	Raises
 	------
 	TypeError : if ``obj`` is not a str or :class:`.OrgNode` or iterable of these.
 	"""
+	if type(obj) is SecondaryString:
+		return obj
+
 	if isinstance(obj, (str, OrgNode)):
-		return [obj]
+		return SecondaryString((obj,))
 
-	ss = list(obj)
+	ss = SecondaryString(obj)
 	for item in ss:
 		if not isinstance(item, (str, OrgNode)):
-			raise TypeError('Items must be OrgNode or str, got %r' % type(item))
+			raise TypeError(f'Items must be OrgNode or str, got {type(item)!r}')
 
 	return ss
 
@@ -629,28 +905,40 @@ class OrgDocument:
 	def assign_header_ids(self, depth=3):
 		"""Assign unique IDs to headers."""
 		assigned = {}
-		for child in self.root.subheadings:
-			self._assign_header_ids(child, assigned, depth)
-		return assigned
+		stack = [(header, depth) for header in reversed(self.root.subheadings)]
+
+		counts = {}
 
-	def _assign_header_ids(self, header, assigned, depth):
+		while stack:
+			header, d = stack.pop()
 
-		id_ = self._make_header_id(header, assigned)
-		header.id = id_
-		assigned[id_] = header
+			id_ = self._make_header_id(header, assigned, counts)
+			header.id = id_
+			assigned[id_] = header
 
-		if depth > 1:
-			for child in header.subheadings:
-				self._assign_header_ids(child, assigned, depth - 1)
+			if d > 1:
+				stack.extend((child, d - 1) for child in reversed(header.subheadings))
 
-	def _make_header_id(self, header, assigned=None):
+		return assigned
+
+	def _make_header_id(self, header, assigned=None, counts=None):
+		id = base = _slugify(header.title)
 		if assigned is None:
-			assigned = []
-		id = base = re.sub(r'[^\w_-]+', '-', header.title).strip('-')
-		i = 1
+			return id
+
+		# counts tracks the last suffix used per base slug, making collision
+		# handling O(1) instead of re-probing from 2 every time.
+		i = 1 if counts is None else counts.get(base, 0) + 1
+		if i > 1:
+			id = f'{base}-{i}'
+
 		while id in assigned:
 			i += 1
-			id = '%s-%d' % (base, i)
+			id = f'{base}-{i}'
+
+		if counts is not None:
+			counts[base] = i
+
 		return id
 
 
@@ -667,7 +955,10 @@ class DispatchNodeType(SingleDispatchBase):
 
 def dispatch_node_type(parent=None):
 	"""Decorator to create DispatchNodeType instance from default implementation."""
-	registry = {} if parent is None else ChainMap(parent, {})
+	# Copy the parent registry into a flat dict - dispatch happens per node
+	# during conversion and a plain dict lookup beats walking a ChainMap.
+	# Registrations on the child also no longer leak into the parent.
+	registry = {} if parent is None else dict(parent)
 
 	def decorator(default):
 		return DispatchNodeType(default, registry)
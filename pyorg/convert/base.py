@@ -1,4 +1,5 @@
-from collections import ChainMap
+from types import MappingProxyType
+
 from pyorg.util import TreeNamespace
 
 
@@ -15,6 +16,16 @@ class OrgConverterBase:
 		'date_format': '%Y-%m-%d %a',
 	}
 
+	def __init_subclass__(cls, **kw):
+		super().__init_subclass__(**kw)
+		# Merge DEFAULT_CONFIG entries from the whole hierarchy once at class
+		# creation, so subclasses only declare their own keys and instance
+		# construction copies a single prebuilt dict.
+		merged = {}
+		for base in reversed(cls.__mro__):
+			merged.update(base.__dict__.get('DEFAULT_CONFIG', {}))
+		cls.DEFAULT_CONFIG = merged
+
 	def __init__(self, config=None, **kw):
 		"""
 		Parameters
@@ -24,10 +35,18 @@ class OrgConverterBase:
 		kw
 			Keyword arguments to update configuration with.
 		"""
-		config = {} if config is None else dict(config)
+		# Flatten defaults and overrides into one dict - config values are
+		# read per node during conversion and a ChainMap lookup walks its
+		# maps on every access.
+		self.config = dict(self.DEFAULT_CONFIG)
+		if config is not None:
+			self.config.update(config)
 		if kw:
-			config = {**config, **kw}
-		self.config = ChainMap(config, self.DEFAULT_CONFIG)
+			self.config.update(kw)
+
+		# Shared read-only view handed to conversion contexts, so per-call
+		# context setup never copies the config.
+		self._config_view = MappingProxyType(self.config)
 
 	def convert(self, node, **kwargs):
 		ctx = self._init_ctx(node, kwargs)
@@ -35,7 +54,7 @@ class OrgConverterBase:
 
 	def _init_ctx(self, root, kwargs):
 		"""Initialize context namespace."""
-		return TreeNamespace(root=root, kwargs=kwargs)
+		return TreeNamespace(root=root, kwargs=kwargs, config=self._config_view)
 
 	def _convert(self, node, ctx):
 		"""Recursively convert an org AST node."""
@@ -1,4 +1,4 @@
 """Export org mode AST nodes to HTML."""
 
 from .element import HtmlElement, write_html, html_to_string
-from .converter import OrgHtmlConverter, to_html
+from .converter import OrgHtmlConverter, to_html, to_html_stream
@@ -1,13 +1,21 @@
-from collections import ChainMap
+import os.path
 import re
-from pathlib import Path
+import sys
 
 from pyorg.ast import OrgNode, OrgTimestamp, ORG_NODE_TYPES, get_node_type, as_node_type, dispatch_node_type
 from pyorg.util import SingleDispatch
-from .element import HtmlElement, TextNode
+from .element import HtmlElement, TextNode, write_html
 from pyorg.convert.base import OrgConverterBase
 
 
+#: Matches the delimiters around a latex fragment's value.
+_LATEX_DELIM_RE = re.compile(r'(\$\$?|\\[\[(])(.*?)(\$\$?|\\[\])])', re.S)
+
+# Node type singletons compared by identity in per-cell/per-item asserts.
+_ITEM_TYPE = ORG_NODE_TYPES['item']
+_TABLE_CELL_TYPE = ORG_NODE_TYPES['table-cell']
+
+
 class OrgHtmlConverter(OrgConverterBase):
 
 	# Default HTML tag for each node type. None means to skip.
@@ -41,16 +49,20 @@ class OrgHtmlConverter(OrgConverterBase):
 		'keyword': None
 	}
 
+	# Members are interned so that membership tests on node type names (also
+	# interned) short-circuit on pointer identity before comparing characters.
 	INLINE_NODES = frozenset(
+		sys.intern(name) for name in
 		{'paragraph', 'example-block', 'fixed-width'}
 		| {nt.name for nt in ORG_NODE_TYPES.values() if nt.is_object}
 	)
 
+	# Inherited entries are merged in by OrgConverterBase.__init_subclass__.
 	DEFAULT_CONFIG = {
 		'latex_delims': ('$$', '$$'),
 		'latex_inline_delims': (r'\(', r'\)'),
 		'resolve_link': {},
-		**OrgConverterBase.DEFAULT_CONFIG
+		'warn_unknown_types': True,
 	}
 
 	DEFAULT_RESOLVE_LINK = {
@@ -58,15 +70,76 @@ class OrgHtmlConverter(OrgConverterBase):
 		'https': True,
 	}
 
-	def default_tag(self, type_):
-		type_ = as_node_type(type_)
+	def __init__(self, config=None, **kw):
+		super().__init__(config, **kw)
+
+		# Per-type tag and CSS class tables, built once from TAGS (as seen on
+		# this instance's class) - default_tag/default_classes are hit for
+		# every converted node. Mutating self.TAGS afterwards won't be
+		# reflected here.
+		self._tag_cache = {
+			name: self.TAGS.get(name, 'span' if nt.is_object else 'div')
+			for name, nt in ORG_NODE_TYPES.items()
+		}
+		self._classes_cache = {
+			name: ('org-node', 'org-' + name) for name in ORG_NODE_TYPES
+		}
+
+		# Types with an explicit TAGS entry - checked per node only when the
+		# unknown-type warning is enabled.
+		self._known_types = frozenset(self.TAGS) if self.config['warn_unknown_types'] else None
+
+		# Memoizes class strings built from per-node values (todo keywords,
+		# link types, header levels, ...) - these draw from a small alphabet
+		# but were formatted fresh for every node.
+		self._class_cache = {}
+
+		# INLINE_NODES resolved to the node type singletons, so the per-node
+		# inline test hashes and compares the type object by identity rather
+		# than a name string.
+		self._inline_types = frozenset(
+			nt for name, nt in ORG_NODE_TYPES.items() if name in self.INLINE_NODES
+		)
+
+		# Resolved once - read for every latex fragment.
+		self._latex_delims = tuple(self.config['latex_delims'])
+		self._latex_inline_delims = tuple(self.config['latex_inline_delims'])
+
+		# Image suffixes checked per file link.
+		self._image_extensions = frozenset(self.config['image_extensions'])
+
+		# Class defaults merged with configured handlers once, instead of a
+		# fresh ChainMap per resolved link.
+		self._resolve_link_map = {**self.DEFAULT_RESOLVE_LINK, **self.config.get('resolve_link', {})}
+
+		# Memoizes resolve_link results - documents commonly repeat links,
+		# and configured handlers may hit the filesystem. Reset per
+		# conversion.
+		self._link_cache = {}
+
+		# The dispatch descriptors create a new bound wrapper on every
+		# attribute access - bind them once so self._convert etc. resolve
+		# through the instance dict during conversion.
+		cls = type(self)
+		self._convert = cls._convert.bind(self, cls)
+		self._convert_node = cls._convert_node.bind(self, cls)
+		self._make_elem = cls._make_elem.bind(self, cls)
+
+	def _cached_class(self, prefix, value):
+		"""Memoize a class (or tag) string built from a prefix and a node value."""
+		key = (prefix, value)
 		try:
-			return self.TAGS[type_.name]
+			return self._class_cache[key]
 		except KeyError:
-			return 'span' if type_.is_object else 'div'
+			s = prefix + str(value)
+			self._class_cache[key] = s
+			return s
+
+	def default_tag(self, type_):
+		return self._tag_cache[as_node_type(type_).name]
 
 	def default_classes(self, type):
-		return ['org-node', 'org-' + type.name]
+		return self._classes_cache[type.name]
 
 	def convert(self, node, dom=False, **kwargs):
 		"""Convert org node to HTML.
@@ -82,6 +155,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		-------
 		str or HtmlElement
 		"""
+		self._link_cache = {}
 		elem = super().convert(node, **kwargs)
 
 		if dom:
@@ -89,10 +163,27 @@ class OrgHtmlConverter(OrgConverterBase):
 
 		return str(elem)
 
+	def convert_to_stream(self, node, stream, **kwargs):
+		"""Convert org node to HTML and write it to a stream.
+
+		Serialized fragments are written to the stream as they are produced,
+		so the full HTML string is never materialized in memory.
+
+		Parameters
+		----------
+		node : pyorg.ast.OrgNode
+			Org node to convert.
+		stream
+			Writable text stream.
+		"""
+		self._link_cache = {}
+		elem = super().convert(node, **kwargs)
+		write_html(stream, elem)
+
 	@SingleDispatch
 	def _convert(self, what, ctx):
 		"""Convert an org AST node OR text to HTML element."""
-		raise TypeError("Can't convert object of type %r" % type(what))
+		raise TypeError(f"Can't convert object of type {type(what)!r}")
 
 	@_convert.register(str)
 	def _convert_string(self, string, ctx):
@@ -122,26 +213,28 @@ class OrgHtmlConverter(OrgConverterBase):
 		Make the HTML element for a given org node (but do not recurse to
 		children).
 		"""
+		ntype = node.type
+		type_name = ntype.name
 		no_default = False
 
 		if tag is None:
-			tag = self.default_tag(node.type.name)
-			if node.type.name not in self.TAGS:
+			tag = self._tag_cache[type_name]
+			if self._known_types is not None and type_name not in self._known_types:
 				no_default = True
 
 			if tag is None:
 				return None
 
-		if node.type.name in self.INLINE_NODES:
+		if ntype in self._inline_types:
 			kwargs.setdefault('inline', True)
 			kwargs.setdefault('post_ws', node.properties.get('post-blank', 0) > 0)
 
 		html = self._make_elem_base(tag, **kwargs)
-		html.add_class(self.default_classes(node.type))
+		html.add_class(self._classes_cache[type_name])
 
 		# Warn about no default tag
 		if no_default:
-			msg = "Don't know how to convert node of type %r" % node.type.name
+			msg = f"Don't know how to convert node of type {type_name!r}"
 			self._add_error(html)
 			html.children.append(self._make_error_msg(msg))
 
@@ -149,10 +242,40 @@ class OrgHtmlConverter(OrgConverterBase):
 
 	def _add_children(self, parent, org_nodes, ctx):
 		"""Recursively _convert org AST nodes and add to parent html element."""
-		for i, node in enumerate(org_nodes):
-			html = self._convert(node, ctx._push(i))
-			if html is not None:
-				parent.children.append(html)
+		if parent.inline:
+			# In an inline context adjacent text renders with no separator,
+			# so runs of plain strings (which dominate paragraph contents)
+			# can be collapsed into a single TextNode instead of dispatching
+			# each one through _convert.
+			append = parent.children.append
+			run = None
+
+			for i, node in enumerate(org_nodes):
+				if type(node) is str:
+					if run is None:
+						run = [node]
+					else:
+						run.append(node)
+					continue
+
+				if run is not None:
+					append(TextNode(run[0] if len(run) == 1 else ''.join(run)))
+					run = None
+
+				html = self._convert(node, ctx._push(i))
+				if html is not None:
+					append(html)
+
+			if run is not None:
+				append(TextNode(run[0] if len(run) == 1 else ''.join(run)))
+
+		else:
+			# Block context puts each child on its own line, so strings are
+			# converted one at a time as before.
+			for i, node in enumerate(org_nodes):
+				html = self._convert(node, ctx._push(i))
+				if html is not None:
+					parent.children.append(html)
 
 	def _make_text(self, node, text, ctx):
 		"""Create plain text from org node.
@@ -191,7 +314,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		"""
 		Make the HTML element for the headline itself, without section or subheadings.
 		"""
-		tag = 'h%d' % min(headline.level + 1, 6)
+		tag = self._cached_class('h', min(headline.level + 1, 6))
 		header = self._make_elem.default(headline, ctx, tag=tag, inline=True)
 
 		# TODO info
@@ -219,8 +342,8 @@ class OrgHtmlConverter(OrgConverterBase):
 			text=headline['todo-keyword'],
 			classes=[
 				'org-todo-kw',
-				'org-todo-' + headline['todo-type'],
-				'org-todo-kw-' + headline['todo-keyword'],
+				self._cached_class('org-todo-', headline['todo-type']),
+				self._cached_class('org-todo-kw-', headline['todo-keyword']),
 			],
 			post_ws=True,
 		))
@@ -229,7 +352,7 @@ class OrgHtmlConverter(OrgConverterBase):
 			todo.children.append(self._make_elem_base(
 				'span',
 				text=headline.priority_chr,
-				classes='org-todo-priority org-priority-' + headline.priority_chr,
+				classes=self._cached_class('org-todo-priority org-priority-', headline.priority_chr),
 				post_ws=True,
 			))
 
@@ -238,14 +361,10 @@ class OrgHtmlConverter(OrgConverterBase):
 	def _make_headline_tags(self, headline, ctx):
 		"""Make the element for the headline's tags."""
 		elem = self._make_elem_base('span', classes='org-tags')
-
-		for tag in headline['tags']:
-			elem.children.append(self._make_elem_base(
-				'span',
-				text=tag,
-				classes='org-tag',
-				post_ws=True,
-			))
+		elem.children = [
+			self._make_elem_base('span', text=tag, classes='org-tag', post_ws=True)
+			for tag in headline['tags']
+		]
 		return elem
 
 	def _make_headline_planning(self, headline, ctx):
@@ -281,7 +400,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		assert node.is_outline
 
 		html = HtmlElement('div')
-		html.classes = 'org-header-container org-header-level-%d' % node.level
+		html.classes = self._cached_class('org-header-container org-header-level-', node.level)
 
 		# ID
 		if node.id:
@@ -299,11 +418,11 @@ class OrgHtmlConverter(OrgConverterBase):
 		# Add classes for TODO info
 		if node.has_todo:
 			html.add_class('org-has-todo')
-			html.add_class('org-todo-%s' % node['todo-type'])
-			html.add_class('org-todo-kw-%s' % node['todo-keyword'])
+			html.add_class(self._cached_class('org-todo-', node['todo-type']))
+			html.add_class(self._cached_class('org-todo-kw-', node['todo-keyword']))
 
 			if node.priority_chr:
-				html.add_class('org-priority-' + node.priority_chr)
+				html.add_class(self._cached_class('org-priority-', node.priority_chr))
 
 		return html
 
@@ -327,9 +446,10 @@ class OrgHtmlConverter(OrgConverterBase):
 
 		html = self._make_elem.default(node, ctx, tag=tag)
 
+		append = html.children.append
 		for i, item in enumerate(node.contents):
-			assert item.type.name == 'item'
-			html.children.append(self._convert_uo_list_item(item, ctx._push(i)))
+			assert item.type is _ITEM_TYPE
+			append(self._convert_uo_list_item(item, ctx._push(i)))
 
 		return html
 
@@ -340,7 +460,7 @@ class OrgHtmlConverter(OrgConverterBase):
 
 		# Checkbox state
 		if node['checkbox']:
-			html.add_class('org-has-checkbox org-checkbox-%s' % node['checkbox'])
+			html.add_class(self._cached_class('org-has-checkbox org-checkbox-', node['checkbox']))
 
 			input = self._make_elem_base(
 				'input',
@@ -369,7 +489,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		dlist = self._make_elem.default(node, ctx, tag='dl')
 
 		for i, item in enumerate(node.children):
-			assert item.type.name == 'item'
+			assert item.type is _ITEM_TYPE
 
 			ctxi = ctx._push(i)
 
@@ -396,7 +516,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		return self._make_text(node, node['utf-8'], ctx)
 
 	def _convert_link_default(self, node, ctx, url=None):
-		html = self._make_elem.default(node, ctx, classes='org-linktype-' + node['type'])
+		html = self._make_elem.default(node, ctx, classes=self._cached_class('org-linktype-', node['type']))
 
 		# Add contents (these come from description part of link)
 		if node.contents:
@@ -422,14 +542,14 @@ class OrgHtmlConverter(OrgConverterBase):
 			html = self._convert_link_default(node, ctx, url=url)
 		else:
 			html = self._convert_link_default(node, ctx)
-			self._add_error(html, text="Can't convert link %r!" % node['raw-link'])
+			self._add_error(html, text=f"Can't convert link {node['raw-link']!r}!")
 
 		return html
 
 	def _convert_file_link(self, node, ctx, url):
-		path = Path(node['path'])
+		suffix = os.path.splitext(node['path'])[1]
 
-		if path.suffix in self.config['image_extensions'] and not node.contents:
+		if suffix in self._image_extensions and not node.contents:
 			return self._convert_image(node, ctx, url)
 
 		return self._convert_link_default(node, ctx, url)
@@ -442,8 +562,18 @@ class OrgHtmlConverter(OrgConverterBase):
 
 	def resolve_link(self, linktype, raw, path, ctx=None):
 		"""Resolve link into a proper URL."""
-		resolve_link = ChainMap(self.config.get('resolve_link', {}), self.DEFAULT_RESOLVE_LINK)
-		resolve = resolve_link.get(linktype)
+		key = (linktype, raw, path)
+		try:
+			return self._link_cache[key]
+		except KeyError:
+			pass
+
+		url = self._resolve_link_uncached(linktype, raw, path)
+		self._link_cache[key] = url
+		return url
+
+	def _resolve_link_uncached(self, linktype, raw, path):
+		resolve = self._resolve_link_map.get(linktype)
 
 		if resolve is None or resolve is False:
 			return None
@@ -465,7 +595,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		value = node['value']
 
 		# Remove delimiters, if any
-		match = re.fullmatch(r'(\$\$?|\\[[(])(.*?)(\$\$?|\\[\])])', value, re.S)
+		match = _LATEX_DELIM_RE.fullmatch(value)
 		if match:
 			d1, latex, d2 = match.groups()
 			inline = d1 in ('$', '\\(')
@@ -473,7 +603,7 @@ class OrgHtmlConverter(OrgConverterBase):
 			latex = value
 			inline = True
 
-		d1, d2 = self.config['latex_inline_delims' if inline else 'latex_delims']
+		d1, d2 = self._latex_inline_delims if inline else self._latex_delims
 		text = d1 + latex + d2
 		return self._make_text(node, text, ctx)
 
@@ -533,16 +663,21 @@ class OrgHtmlConverter(OrgConverterBase):
 		return table_elem
 
 	def _convert_table_row(self, node, ctx, header=False):
-		row_elem = self._make_elem_base('tr')
+		cell_tag = 'th' if header else 'td'
 
+		# Cells are plain elements with no extra attrs, so they are built
+		# directly and attached to the row in one assignment rather than
+		# going through _make_elem_base and append per cell.
+		cells = []
 		for i, cell in enumerate(node):
-			assert cell.type.name == 'table-cell'
-
-			cell_elem = self._make_elem_base('th' if header else 'td')
-			row_elem.children.append(cell_elem)
+			assert cell.type is _TABLE_CELL_TYPE
 
+			cell_elem = HtmlElement(cell_tag)
 			self._add_children(cell_elem, cell.contents, ctx._push(i))
+			cells.append(cell_elem)
 
+		row_elem = HtmlElement('tr')
+		row_elem.children = cells
 		return row_elem
 
 	@_convert.register(OrgTimestamp)
@@ -556,7 +691,7 @@ class OrgHtmlConverter(OrgConverterBase):
 		elif ts.tstype in ('inactive', 'inactive-range'):
 			html.add_class('org-timestamp-inactive')
 		else:
-			html.add_class('org-timestamp-' + ts.tstype)
+			html.add_class(self._cached_class('org-timestamp-', ts.tstype))
 
 		fmt = self.config['date_format']
 
@@ -564,7 +699,7 @@ class OrgHtmlConverter(OrgConverterBase):
 			html.add_class('org-timestamp-range')
 			start = ts.start.strftime(fmt)
 			end = ts.end.strftime(fmt)
-			html.children.append('%s to %s' % (start, end))
+			html.children.append(f'{start} to {end}')
 
 		else:
 			html.children.append((ts.start or ts.end).strftime(fmt))
@@ -590,3 +725,19 @@ def to_html(node, dom=False, **kwargs):
 	"""
 	converter = OrgHtmlConverter(**kwargs)
 	return converter.convert(node, dom=dom)
+
+
+def to_html_stream(node, stream, **kwargs):
+	"""Convert org node to HTML and write it to a stream.
+
+	Parameters
+	----------
+	node : pyorg.ast.OrgNode
+		Org node to convert.
+	stream
+		Writable text stream.
+	kwargs
+		Keyword arguments to :class:`.OrgHtmlConverter` constructor.
+	"""
+	converter = OrgHtmlConverter(**kwargs)
+	converter.convert_to_stream(node, stream)
@@ -1,5 +1,37 @@
-from html import escape
-from io import StringIO
+import re
+from functools import lru_cache
+
+
+# Equivalent to html.escape(s, quote=True), but applied in a single C-level
+# pass over the string instead of five chained str.replace calls.
+_ESCAPE_TRANS = str.maketrans({
+	'&': '&amp;',
+	'<': '&lt;',
+	'>': '&gt;',
+	'"': '&quot;',
+	"'": '&#x27;',
+})
+
+
+# Finds the first character needing escaping, if any.
+_ESCAPE_SEARCH = re.compile(r'[&<>"\']').search
+
+
+def _escape_text(s):
+	"""Escape text content, returning it unchanged when it needs no escaping.
+
+	Most text runs contain no escapable characters, so a single C-level scan
+	avoids the translate pass and its new string allocation in the common
+	case.
+	"""
+	return s if _ESCAPE_SEARCH(s) is None else s.translate(_ESCAPE_TRANS)
+
+
+@lru_cache(maxsize=4096)
+def _escape_short(s):
+	"""Escape a string drawn from a small repeating set (attribute keys, class
+	lists, ...), memoizing the result."""
+	return s.translate(_ESCAPE_TRANS)
 
 
 class TextNode:
@@ -14,12 +46,14 @@ class TextNode:
 		context.
 	"""
 
+	__slots__ = ('text', 'post_ws')
+
 	def __init__(self, text, post_ws=False):
 		self.text = text
 		self.post_ws = post_ws
 
 	def __str__(self):
-		return escape(self.text)
+		return _escape_text(self.text)
 
 
 class HtmlElement:
@@ -45,10 +79,15 @@ class HtmlElement:
 		context.
 	"""
 
+	__slots__ = ('tag', 'children', 'attrs', 'inline', 'post_ws')
+
 	def __init__(self, tag, children=None, attrs=None, inline=False, post_ws=False):
 		self.tag = tag
-		self.children = list(children or [])
-		self.attrs = dict(attrs or [])
+		# Containers passed as exact list/dict are adopted by reference -
+		# callers build them fresh, and copying every one is pure overhead on
+		# large trees.
+		self.children = children if type(children) is list else ([] if children is None else list(children))
+		self.attrs = attrs if type(attrs) is dict else ({} if attrs is None else dict(attrs))
 		self.inline = inline
 		self.post_ws = post_ws
 
@@ -82,56 +121,99 @@ class HtmlElement:
 		return html_to_string(self)
 
 
-def _write_html_recursive(stream, elem, indent, depth, inline=False):
-	inline = inline or elem.inline
-
-	# Opening tag and attrs
-	stream.write('<' + elem.tag)
-
-	for key, value in elem.attrs.items():
-		if isinstance(value, str):
-			stream.write(' %s="%s"' % (escape(key), escape(value)))
-		elif isinstance(value, bool):
-			if value:
-				stream.write(' %s' % escape(key))
-		else:
-			raise TypeError(type(value))
-
-	stream.write('>')
-
-	for child in elem.children:
-		if not inline:
-			stream.write('\n')
-			stream.write(indent * (depth + 1))
+def iter_html(elem, indent='\t', inline=False):
+	"""Iteratively generate the serialized HTML of an element as string fragments.
 
-		post_ws = False
+	Runs on an explicit stack instead of recursing per element, and yields
+	plain string fragments so callers can stream or join them without any
+	intermediate per-subtree strings.
 
-		if isinstance(child, str):
-			stream.write(escape(child))
-		elif isinstance(child, TextNode):
-			stream.write(escape(child.text))
-			post_ws = child.post_ws
-		elif isinstance(child, HtmlElement):
-			_write_html_recursive(stream, child, indent=indent, depth=depth + 1, inline=inline)
-			post_ws = child.post_ws
-		else:
-			raise TypeError(type(child))
-
-		if inline and post_ws:
-			stream.write(' ')
-
-	if elem.children and not inline:
-		stream.write('\n')
-		stream.write(indent * depth)
+	Parameters
+	----------
+	elem : .HtmlElement
+	indent : str
+		String to indent nested elements with.
+	inline : bool
+		Render in an inline context (no newlines/indentation between children).
 
-	stream.write('</%s>' % elem.tag)
+	Yields
+	------
+	str
+	"""
+	# Entries are either ready fragments (str) or (elem, depth, inline)
+	# tuples for elements still to be opened.
+	stack = [(elem, 0, inline)]
+
+	while stack:
+		entry = stack.pop()
+
+		if type(entry) is str:
+			yield entry
+			continue
+
+		elem, depth, inline = entry
+		inline = inline or elem.inline
+
+		# Opening tag and attrs
+		parts = ['<', elem.tag]
+
+		for key, value in elem.attrs.items():
+			if isinstance(value, str):
+				# Attribute keys and most values (class lists, short hrefs)
+				# repeat heavily across a document; long values bypass the
+				# cache to keep it from filling with one-off strings.
+				if len(value) > 64:
+					value = value.translate(_ESCAPE_TRANS)
+				else:
+					value = _escape_short(value)
+				parts.append(f' {_escape_short(key)}="{value}"')
+			elif isinstance(value, bool):
+				if value:
+					parts.append(' ' + _escape_short(key))
+			else:
+				raise TypeError(type(value))
+
+		parts.append('>')
+		yield ''.join(parts)
+
+		# Children and closing tag are queued in reverse so they come off
+		# the stack in document order.
+		tail = []
+		pad = '\n' + indent * (depth + 1)
+
+		for child in elem.children:
+			if not inline:
+				tail.append(pad)
+
+			post_ws = False
+
+			if isinstance(child, str):
+				tail.append(_escape_text(child))
+			elif isinstance(child, TextNode):
+				tail.append(_escape_text(child.text))
+				post_ws = child.post_ws
+			elif isinstance(child, HtmlElement):
+				tail.append((child, depth + 1, inline))
+				post_ws = child.post_ws
+			else:
+				raise TypeError(type(child))
+
+			if inline and post_ws:
+				tail.append(' ')
+
+		if elem.children and not inline:
+			tail.append('\n' + indent * depth)
+
+		tail.append('</' + elem.tag + '>')
+
+		stack.extend(reversed(tail))
 
 
 def write_html(stream, elem, indent='\t', inline=False):
-	_write_html_recursive(stream, elem, indent, depth=0, inline=inline)
+	write = stream.write
+	for fragment in iter_html(elem, indent, inline=inline):
+		write(fragment)
 
 
 def html_to_string(elem, **kwargs):
-	buf = StringIO()
-	write_html(buf, elem, **kwargs)
-	return buf.getvalue()
+	return ''.join(iter_html(elem, **kwargs))
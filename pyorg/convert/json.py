@@ -7,13 +7,28 @@ from ..ast import dispatch_node_type, OrgNode
 
 
 class OrgJsonConverter(OrgConverterBase):
+	# Inherited entries are merged in by OrgConverterBase.__init_subclass__.
 	DEFAULT_CONFIG = {
 		'object_type_key': '$$data_type',
-		**OrgConverterBase.DEFAULT_CONFIG
 	}
 
+	def __init__(self, config=None, **kw):
+		super().__init__(config, **kw)
+
+		# Resolved once - make_object runs for every node and mapping.
+		self._type_key = self.config.get('object_type_key')
+
+		# The dispatch descriptors create a new bound wrapper on every
+		# attribute access - bind them once so per-node lookups resolve
+		# through the instance dict.
+		cls = type(self)
+		self._convert_node = cls._convert_node.bind(self, cls)
+		self._convert_properties = cls._convert_properties.bind(self, cls)
+		self._convert_contents = cls._convert_contents.bind(self, cls)
+		self._convert_contents_item = cls._convert_contents_item.bind(self, cls)
+
 	def make_object(self, type_, data):
-		key = self.config.get('object_type_key')
+		key = self._type_key
 		if key is not None:
 			assert key not in data
 			return {key: type_, **data}
@@ -59,9 +74,16 @@ class OrgJsonConverter(OrgConverterBase):
 		return self._convert(item, ctx)
 
 	def _convert(self, value, ctx):
+		# Leaves (strings and numbers) dominate large ASTs, so exact scalar
+		# types return immediately - the isinstance ladder below only runs
+		# for nodes, containers and scalar subclasses.
+		t = type(value)
+		if t is str or t is int or t is float or t is bool or value is None:
+			return value
+
 		if isinstance(value, OrgNode):
 			return self._convert_node(value, ctx)
-		if isinstance(value, (str, int, float, bool, type(None))):
+		if isinstance(value, (str, int, float, bool)):
 			return value
 		if isinstance(value, Sequence):
 			return [self._convert(item, ctx._push(i)) for i, item in enumerate(value)]
@@ -3,6 +3,8 @@
 import os
 from pathlib import Path
 import json
+import pickle
+from hashlib import md5
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
 from tempfile import TemporaryDirectory
@@ -10,6 +12,70 @@ from tempfile import TemporaryDirectory
 from .io import org_doc_from_json
 from .elisp import export_org_file
 
+try:
+	import orjson as _orjson
+except ImportError:
+	_orjson = None
+
+
+def _load_json_file(path):
+	"""Load a JSON file, using :mod:`orjson` if it is installed.
+
+	orjson parses the raw bytes directly and is several times faster than the
+	stdlib json module on large exports; fall back to :func:`json.load`
+	otherwise.
+	"""
+	if _orjson is not None:
+		with open(str(path), 'rb') as f:
+			return _orjson.loads(f.read())
+	with open(str(path), encoding='utf8') as f:
+		return json.load(f)
+
+
+def load_ast_cached(file, cache_dir=None):
+	"""Parse an org document from an exported JSON file, caching the parsed AST.
+
+	The parsed document is pickled under ``cache_dir`` keyed on the JSON file's
+	size and modification time plus the pyorg version, so repeat loads of an
+	unchanged file skip JSON parsing and AST construction entirely.
+
+	Parameters
+	----------
+	file : str or pathlib.Path
+		Path to JSON file exported from an org file.
+	cache_dir : str or pathlib.Path
+		Directory to store pickled ASTs in. Defaults to a ``.pyorg_cache``
+		directory next to ``file``.
+
+	Returns
+	-------
+	pyorg.ast.OrgDocument
+	"""
+	from pyorg import __version__
+
+	file = Path(file).absolute()
+	cache_dir = file.parent / '.pyorg_cache' if cache_dir is None else Path(cache_dir)
+
+	st = file.stat()
+	prefix = md5(str(file).encode()).hexdigest()
+	cached = cache_dir / ('%s-%d-%d-%s.pkl' % (prefix, st.st_size, st.st_mtime_ns, __version__))
+
+	if cached.is_file():
+		with cached.open('rb') as f:
+			return pickle.load(f)
+
+	doc = org_doc_from_json(_load_json_file(file))
+
+	# Drop cache entries for older versions of the file before writing.
+	cache_dir.mkdir(parents=True, exist_ok=True)
+	for old in cache_dir.glob(prefix + '-*.pkl'):
+		old.unlink()
+
+	with cached.open('wb') as f:
+		pickle.dump(doc, f, pickle.HIGHEST_PROTOCOL)
+
+	return doc
+
 
 class OrgDirectory:
 	"""The directory where the user's org files are kept.
@@ -28,6 +94,9 @@ class OrgDirectory:
 		if path is self:
 			return
 		self.path = Path(path).expanduser().absolute()
+		# Cached non-recursive listings, keyed by (directory, hidden) and
+		# validated against the directory's modification time.
+		self._listing_cache = {}
 
 	def __repr__(self):
 		return '%s(%r)' % (type(self).__name__, str(self.path))
@@ -124,11 +193,35 @@ class OrgDirectory:
 			Iterator over :class:`pathlib.Path` instances.
 		"""
 		abspath = self.path if path is None else self.get_abs_path(path)
-		pattern = '**/*.org' if recursive else '*.org'
 
-		for file in abspath.glob(pattern):
-			if hidden or not file.name.startswith('.'):
-				yield file.relative_to(self.path)
+		if recursive:
+			for dirpath, dirnames, filenames in os.walk(str(abspath)):
+				reldir = Path(dirpath).relative_to(self.path)
+				for name in filenames:
+					if name.endswith('.org') and (hidden or not name.startswith('.')):
+						yield reldir / name
+		else:
+			# Adding/removing/renaming entries updates the directory's mtime,
+			# so a cached listing can be reused until it changes.
+			key = (str(abspath), hidden)
+			mtime = os.stat(str(abspath)).st_mtime_ns
+			cached = self._listing_cache.get(key)
+
+			if cached is not None and cached[0] == mtime:
+				yield from cached[1]
+				return
+
+			# os.scandir() reuses the file type info returned by the directory
+			# read, avoiding a stat() call per entry.
+			files = []
+			with os.scandir(str(abspath)) as entries:
+				for entry in entries:
+					name = entry.name
+					if name.endswith('.org') and (hidden or not name.startswith('.')) and entry.is_file():
+						files.append((abspath / name).relative_to(self.path))
+
+			self._listing_cache[key] = (mtime, files)
+			yield from files
 
 	def _get_org_file(self, path):
 		"""Convert path to absolute, ensuring it is an org file within the directory.
@@ -201,8 +294,7 @@ class DirectFileLoader(OrgFileLoader):
 		with TemporaryDirectory() as tmpdir:
 			tmpfile = os.path.join(tmpdir, file.stem + '.json')
 			export_org_file(self.emacs, file, tmpfile)
-			with open(tmpfile, encoding='utf8') as f:
-				data = json.load(f)
+			data = _load_json_file(tmpfile)
 
 		return data if raw else org_doc_from_json(data)
 
@@ -237,7 +329,12 @@ class OrgFilesystemCache(OrgFileCache):
 	def _locate_cached(self, file):
 		"""Get the path to the cached file."""
 		file = self.base_dir.get_rel_path(file)
-		return self.cache_dir / file.parent / (file.stem + self.ext)
+		# Build the path with os.path string operations - Path division and
+		# .parent/.stem each allocate and re-split, and this runs for every
+		# cache lookup.
+		dirname, filename = os.path.split(str(file))
+		stem, _ = os.path.splitext(filename)
+		return Path(os.path.join(str(self.cache_dir), dirname, stem + self.ext))
 
 	def get_timestamp(self, file):
 		"""Get the timestamp indicating when the cached file was exported."""
@@ -267,8 +364,7 @@ class OrgFilesystemCache(OrgFileCache):
 
 	def _read(self, file):
 		"""Read file from the cache."""
-		with self._locate_cached(file).open(encoding='utf8') as f:
-			return json.load(f)
+		return _load_json_file(self._locate_cached(file))
 
 	def _remove(self, file):
 		"""Remove file from cache."""
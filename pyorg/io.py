@@ -1,74 +1,163 @@
 """Read (and write) org mode data from JSON and other formats."""
 
+import sys
+
 from .ast import OrgDocument, OrgNode, OrgDataNode, NODE_CLASSES, OrgTimestamp
 from .util import TreeNamespace, parse_iso_date
 
 
 JSON_OBJ_DATA_TYPE_KEY = '$$data_type'
 
+# Bound .get hoisted so class lookup in the loader is a single call. Bound to
+# the live registry dict, so later @node_cls registrations are honored.
+_get_node_cls = NODE_CLASSES.get
 
-def _node_from_json(data, ctx, recurse_contents=True):
-	type_ = data['type']
-	ref = data['ref']
-
-	# Parse child nodes first
-	props = _mapping_from_json(data['properties'], ctx)
-	if recurse_contents:
-		contents = _list_from_json(data['contents'], ctx)
-	else:
-		contents = []
 
-	keywords = _mapping_from_json(data.get('keywords', {}), ctx)
+def _push_node_entries(stack, data, ctx, target, key):
+	"""Queue construction of an org AST node and conversion of its child values.
 
-	cls = NODE_CLASSES.get(type_, OrgNode)
-	node = cls(type_, properties=props, contents=contents, keywords=keywords, ref=ref)
+	Pushes a finalization callback onto the work stack, followed by entries for
+	all of the node's property/keyword/content values. The callback runs after
+	all of those entries have been processed and instantiates the node from the
+	converted values.
+	"""
+	# The type name and property/keyword keys come from a small closed set
+	# but json.load allocates fresh strings for each occurrence; interning
+	# them makes later dict lookups (ORG_NODE_TYPES, node['title'] etc.)
+	# identity-fast and deduplicates the storage across the tree.
+	type_ = sys.intern(data['type'])
+	ref = data['ref']
 
-	return node
+	props = {}
+	keywords = {}
+	contents = [None] * len(data['contents'])
+
+	def make_node():
+		cls = _get_node_cls(type_, OrgNode)
+		target[key] = cls(type_, properties=props, contents=contents, keywords=keywords, ref=ref)
+
+	stack.append(make_node)
+
+	# Primitive values are assigned in place - pushing a work entry (and
+	# deriving a child context) for every scalar property or text run would
+	# dominate the loop.
+	for k, v in data['properties'].items():
+		if k != JSON_OBJ_DATA_TYPE_KEY:
+			k = sys.intern(k)
+			t = type(v)
+			if t is str or t is int or t is float or t is bool or v is None:
+				props[k] = v
+			else:
+				# Reserve the key now so the converted value overwrites it in
+				# place - work entries pop in LIFO order, which would
+				# otherwise insert container values in reverse source order.
+				props[k] = None
+				stack.append((v, ctx._push(k), props, k))
+
+	for k, v in data.get('keywords', {}).items():
+		if k != JSON_OBJ_DATA_TYPE_KEY:
+			k = sys.intern(k)
+			t = type(v)
+			if t is str or t is int or t is float or t is bool or v is None:
+				keywords[k] = v
+			else:
+				keywords[k] = None
+				stack.append((v, ctx._push(k), keywords, k))
+
+	for i, item in enumerate(data['contents']):
+		t = type(item)
+		if t is str or t is int or t is float or t is bool or item is None:
+			contents[i] = item
+		else:
+			stack.append((item, ctx._push(i), contents, i))
+
+
+def _run_json_stack(stack):
+	"""Process a work stack of JSON values to convert.
+
+	Entries are ``(data, ctx, target, key)`` tuples, where ``target`` is the
+	partially-built parent container (list or dict) and ``key`` the index/key
+	to store the converted value under. Callable entries are deferred node
+	construction steps (see :func:`_push_node_entries`) and are simply invoked.
+
+	Using an explicit stack rather than recursion keeps deeply nested
+	documents from hitting the interpreter's recursion limit and avoids
+	per-value function call overhead.
+	"""
+	while stack:
+		entry = stack.pop()
+
+		if callable(entry):
+			entry()
+			continue
+
+		data, ctx, target, key = entry
+
+		# Parsed JSON only ever contains exact list/dict/str/int/float/bool/
+		# None instances, so dispatch on type identity rather than isinstance.
+		t = type(data)
+
+		if t is list:
+			converted = [None] * len(data)
+			target[key] = converted
+			for i, item in enumerate(data):
+				it = type(item)
+				if it is str or it is int or it is float or it is bool or item is None:
+					converted[i] = item
+				else:
+					stack.append((item, ctx._push(i), converted, i))
+
+		elif t is dict:
+			data = dict(data)
+			datatype = data.pop(JSON_OBJ_DATA_TYPE_KEY, 'mapping')
+
+			if datatype == 'org-node':
+				_push_node_entries(stack, data, ctx, target, key)
+
+			elif datatype == 'mapping':
+				converted = {}
+				target[key] = converted
+				for k, v in data.items():
+					vt = type(v)
+					if vt is str or vt is int or vt is float or vt is bool or v is None:
+						converted[k] = v
+					else:
+						# Reserve the key to keep source order (see
+						# _push_node_entries).
+						converted[k] = None
+						stack.append((v, ctx._push(k), converted, k))
+
+			elif datatype == 'error':
+				ctx.errors.append((ctx._path, data['message']))
+				print('Parse error:', data['message'])
+				target[key] = None
+
+			elif datatype == 'timestamp':
+				target[key] = _timestamp_from_json(data, ctx)
+
+			else:
+				ctx.errors.append((ctx._path, 'Unknown data type in JSON export : %r' % datatype))
+				target[key] = None
+
+		elif t is str or t is int or t is float or t is bool or data is None:
+			target[key] = data
+
+		else:
+			raise TypeError(t)
 
 
 def _from_json(data, ctx):
-	if isinstance(data, list):
-		return _list_from_json(data, ctx)
-
-	if isinstance(data, dict):
-		data = dict(data)
-		datatype = data.pop(JSON_OBJ_DATA_TYPE_KEY, 'mapping')
-
-		if datatype == 'org-node':
-			return _node_from_json(data, ctx)
-
-		if datatype == 'mapping':
-			return _mapping_from_json(data, ctx)
-
-		if datatype == 'error':
-			ctx.errors.append((ctx._path, data['message']))
-			print('Parse error:', data['message'])
-			return None
-
-		if datatype == 'timestamp':
-			return _timestamp_from_json(data, ctx)
-
-		ctx.errors.append((ctx._path, 'Unknown data type in JSON export : %r' % datatype))
-		return None
-
-	if isinstance(data, (type(None), bool, int, float, str)):
-		return data
-
-	raise TypeError(type(data))
-
-
-def _list_from_json(data, ctx):
-	return [
-		_from_json(c, ctx._push(i))
-		for (i, c) in enumerate(data)
-	]
+	result = [None]
+	_run_json_stack([(data, ctx, result, 0)])
+	return result[0]
 
 
-def _mapping_from_json(data, ctx):
-	return {
-		k: _from_json(v, ctx._push(k))
-		for k, v in data.items() if k != JSON_OBJ_DATA_TYPE_KEY
-	}
+def _node_from_json(data, ctx):
+	result = [None]
+	stack = []
+	_push_node_entries(stack, data, ctx, result, 0)
+	_run_json_stack(stack)
+	return result[0]
 
 
 def _timestamp_from_json(data, ctx):
@@ -96,7 +185,7 @@ def org_doc_from_json(data):
 		raise ValueError('Expected data type "org-document", got %r' % data_type)
 
 	ctx = _init_ctx(data)
-	contents = _list_from_json(data['contents'], ctx)
+	contents = _from_json(data['contents'], ctx)
 	root = OrgDataNode('org-data', contents=contents)
 
 	doc = OrgDocument(root, properties=data['properties'])
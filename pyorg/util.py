@@ -22,10 +22,19 @@ class SingleDispatchMethod:
 		self.instance = instance
 		self.owner = owner
 		self.__doc__ = func.__doc__
+		# Memoizes bound implementations - binding creates a new method
+		# object each time, which adds up when the same implementations are
+		# dispatched to repeatedly through a long-lived bound function.
+		self._bound = {}
 
 	def dispatch(self, arg):
 		impl = self.func.dispatch(arg)
-		return impl.__get__(self.instance, self.owner)
+		try:
+			return self._bound[impl]
+		except KeyError:
+			bound = impl.__get__(self.instance, self.owner)
+			self._bound[impl] = bound
+			return bound
 
 	def __call__(self, arg, *rest, **kwargs):
 		impl = self.dispatch(arg)
@@ -56,6 +65,9 @@ class SingleDispatchBase(ABC):
 		self.default = default
 		self.registry = {} if registry is None else registry
 		self.__doc__ = doc if doc is not None else default.__doc__
+		# Memoizes resolved implementations (including fallback to the
+		# default) by cache_key(). Cleared on registration.
+		self._cache = {}
 
 	def bind(self, instance, owner=None):
 		"""Get a version of the function bound to the given instance as a method.
@@ -78,16 +90,31 @@ class SingleDispatchBase(ABC):
 	def iter_keys(self, arg):
 		yield self.get_key(arg)
 
+	def cache_key(self, arg):
+		"""Get a hashable key under which to memoize the resolved implementation."""
+		return self.get_key(arg)
+
 	def dispatch(self, arg):
 		"""Get the actual function implementation for the given argument.
 		"""
-		for key in self.iter_keys(arg):
+		key = self.cache_key(arg)
+
+		try:
+			return self._cache[key]
+		except KeyError:
+			pass
+
+		for k in self.iter_keys(arg):
 			try:
-				return self.registry[key]
+				impl = self.registry[k]
+				break
 			except KeyError:
 				pass
+		else:
+			impl = self.default
 
-		return self.default
+		self._cache[key] = impl
+		return impl
 
 	def validate_key(self, key):
 		"""
@@ -137,6 +164,9 @@ class SingleDispatchBase(ABC):
 			for key in keys:
 				self.registry[key] = impl
 
+			# Memoized resolutions (including defaults) may now be stale.
+			self._cache.clear()
+
 			return impl
 
 		if impl is None:
@@ -160,6 +190,9 @@ class SingleDispatch(SingleDispatchBase):
 			raise TypeError('Keys must be types')
 		return key
 
+	def cache_key(self, arg):
+		return type(arg)
+
 	def iter_keys(self, arg):
 		return type(arg).mro()
 
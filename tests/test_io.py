@@ -0,0 +1,119 @@
+"""Test pyorg.io"""
+
+from datetime import date
+
+from pyorg.ast import OrgDataNode, OrgHeadlineNode, OrgNode, OrgTimestamp
+from pyorg.io import org_doc_from_json, org_node_from_json
+
+
+def make_node_data(type_, properties=None, contents=None, ref=None, **kw):
+	"""Create JSON data for an org AST node."""
+	return {
+		'$$data_type': 'org-node',
+		'type': type_,
+		'ref': ref,
+		'properties': properties or {},
+		'contents': contents or [],
+		**kw,
+	}
+
+
+HEADLINE_PROPS = {
+	'title': ['Headline'],
+	'level': 1,
+	'todo-type': None,
+	'todo-keyword': None,
+	'priority': None,
+	'tags': [],
+}
+
+
+def test_org_node_from_json():
+	"""Test parsing a single node with nested contents and properties."""
+
+	data = make_node_data(
+		'paragraph',
+		properties={
+			'post-blank': 0,
+			'timestamp': {
+				'$$data_type': 'timestamp',
+				'type': 'active',
+				'start': '2019-07-11',
+			},
+		},
+		contents=[
+			'Some text ',
+			make_node_data('bold', contents=['bold text']),
+		],
+		ref='abc',
+	)
+
+	node = org_node_from_json(data)
+
+	assert type(node) is OrgNode
+	assert node.type.name == 'paragraph'
+	assert node.ref == 'abc'
+	assert node['post-blank'] == 0
+	assert node.contents[0] == 'Some text '
+
+	bold = node.contents[1]
+	assert bold.type.name == 'bold'
+	assert bold.contents == ['bold text']
+
+	ts = node['timestamp']
+	assert isinstance(ts, OrgTimestamp)
+	assert ts.tstype == 'active'
+	assert ts.start == date(2019, 7, 11)
+
+
+def test_org_doc_from_json():
+	"""Test parsing a document with nested headlines."""
+
+	data = {
+		'$$data_type': 'org-document',
+		'properties': {'title': 'Test'},
+		'contents': [
+			make_node_data(
+				'headline',
+				properties=dict(HEADLINE_PROPS),
+				contents=[
+					make_node_data('section'),
+					make_node_data(
+						'headline',
+						properties={**HEADLINE_PROPS, 'title': ['Nested'], 'level': 2},
+					),
+				],
+			),
+		],
+	}
+
+	doc = org_doc_from_json(data)
+
+	assert type(doc.root) is OrgDataNode
+	assert doc.properties == {'title': 'Test'}
+
+	(headline,) = doc.root.contents
+	assert type(headline) is OrgHeadlineNode
+	assert headline.title == 'Headline'
+	assert headline.level == 1
+
+	nested = headline.contents[1]
+	assert type(nested) is OrgHeadlineNode
+	assert nested.title == 'Nested'
+	assert nested.level == 2
+
+
+def test_deep_nesting():
+	"""Deeply nested data should not hit the interpreter's recursion limit."""
+
+	data = make_node_data('paragraph')
+	for _ in range(2000):
+		data = make_node_data('quote-block', contents=[data])
+
+	node = org_node_from_json(data)
+
+	depth = 0
+	while node.contents:
+		node = node.contents[0]
+		depth += 1
+	assert depth == 2000